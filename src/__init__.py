@@ -3,8 +3,10 @@ from flask import Flask,Blueprint
 from src.config.config import Config
 from dotenv import load_dotenv
 from src.routes import api
+from src.utils.json_provider import OrjsonProvider
 from flask_cors import CORS
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 CORS(app,supports_credentials=True)
 
 load_dotenv()
@@ -4,10 +4,10 @@ class Config:
     def __init__(self):
         self.dev_config = DevConfig()
 
-    API_KEYS = {
-        "demo-key": "ved",
-        "test-key": "ved"
-    }
+    API_KEYS = frozenset({
+        "demo-key",
+        "test-key"
+    })
     
     DATABASE_SCHEMA = {
         "sales": {
@@ -1,53 +1,68 @@
-from flask import Blueprint, Flask, Response, json,request, jsonify
-from flask_cors import CORS
+from flask import Blueprint, request, jsonify
 from src.services.query import QueryProcessor
 from src.utils.errors import InvalidQueryError
 from src.middlewares.auth import authenticate
 
-app = Flask(__name__)
-CORS(app,supports_credentials=True)
-
 processing = Blueprint("processing", __name__)
 
+_QUERY_REQUIRED = {"error": "Query parameter is required"}
+# Upper bound on queries per /query/batch request
+_MAX_BATCH_SIZE = 100
+
+def _extract_query():
+    """Return (query, None), or (None, error response) when the body has no query"""
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict) or 'query' not in data:
+        return None, (jsonify(_QUERY_REQUIRED), 400)
+    return data['query'], None
+
 @processing.route('/hello', methods=["GET"])
 def hello():
-    return Response(
-        response=json.dumps({'status': "success", "message": "Hello"}),
-        status=200,
-        mimetype='application/json'
-    )
+    return jsonify({'status': "success", "message": "Hello"}), 200
 
 @processing.route('/query', methods=['POST'])
 @authenticate
 def query():
-    data = request.get_json()
-    if not data or 'query' not in data:
-        return jsonify({"error": "Query parameter is required"}), 400
+    natural_query, error = _extract_query()
+    if error:
+        return error
     
     try:
-        result = QueryProcessor.process_query(data['query'])
+        result = QueryProcessor.process_query(natural_query)
         return jsonify(result)
     except InvalidQueryError as e:
         return jsonify({"error": str(e)}), 400
 
+@processing.route('/query/batch', methods=['POST'])
+@authenticate
+def query_batch():
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict) or not isinstance(data.get('queries'), list):
+        return jsonify({"error": "Queries parameter must be a list"}), 400
+    if len(data['queries']) > _MAX_BATCH_SIZE:
+        return jsonify({"error": f"At most {_MAX_BATCH_SIZE} queries are allowed per batch"}), 400
+    
+    results = QueryProcessor.process_queries(data['queries'])
+    return jsonify({"status": "success", "results": results})
+
 @processing.route('/explain', methods=['POST'])
 @authenticate
 def explain():
-    data = request.get_json()
-    if not data or 'query' not in data:
-        return jsonify({"error": "Query parameter is required"}), 400
+    natural_query, error = _extract_query()
+    if error:
+        return error
     
-    explanation = QueryProcessor.explain_query(data['query'])
+    explanation = QueryProcessor.explain_query(natural_query)
     return jsonify(explanation)
 
 @processing.route('/validate', methods=['POST'])
 @authenticate
 def validate():
-    data = request.get_json()
-    if not data or 'query' not in data:
-        return jsonify({"error": "Query parameter is required"}), 400
+    natural_query, error = _extract_query()
+    if error:
+        return error
     
-    validation = QueryProcessor.validate_query(data['query'])
+    validation = QueryProcessor.validate_query(natural_query)
     return jsonify(validation)
 
 
@@ -2,27 +2,34 @@ from functools import wraps
 from flask import request, jsonify
 from src.config.config import Config
 
+# 401 bodies never change, so they are built once at import
+_MISSING_KEY_RESPONSE = {
+    "status": "error",
+    "error": "Unauthorized",
+    "message": "API key is missing",
+    "suggestion": "Include API key in X-API-KEY header or request body"
+}
+_INVALID_KEY_RESPONSE = {
+    "status": "error",
+    "error": "Unauthorized",
+    "message": "Invalid API key",
+    "suggestion": f"Valid keys are: {', '.join(sorted(Config.API_KEYS))}"
+}
+
 def authenticate(f):
     @wraps(f)
     def decorated_function(*args, **kwargs):
-        # Check API key in headers or request body
-        api_key = request.headers.get("X-API-KEY") or (request.json.get('api_key') if request.json else None)
+        # Check API key in headers, only parsing the body when the header is absent
+        api_key = request.headers.get("X-API-KEY")
+        if not api_key and request.is_json:
+            data = request.get_json(silent=True)
+            api_key = data.get('api_key') if isinstance(data, dict) else None
         
         if not api_key:
-            return jsonify({
-                "status": "error",
-                "error": "Unauthorized",
-                "message": "API key is missing",
-                "suggestion": "Include API key in X-API-KEY header or request body"
-            }), 401
+            return jsonify(_MISSING_KEY_RESPONSE), 401
         
         if api_key not in Config.API_KEYS:
-            return jsonify({
-                "status": "error",
-                "error": "Unauthorized",
-                "message": "Invalid API key",
-                "suggestion": f"Valid keys are: {', '.join(Config.API_KEYS.keys())}"
-            }), 401
+            return jsonify(_INVALID_KEY_RESPONSE), 401
         
         return f(*args, **kwargs)
     
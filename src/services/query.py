@@ -1,354 +1,417 @@
+import copy
 import re
-from typing import Dict, Any, Optional, Tuple, List
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Any, Optional, Tuple, List, FrozenSet
 from src.utils.database import db_instance
 from src.utils.errors import InvalidQueryError, DatabaseError
 
+# Patterns below only ever see queries normalized by QueryProcessor._normalize
+# (lowercase, single spaces), so none of them need re.IGNORECASE.
+
+# All supported filter phrasings fused into one pattern, compiled once at import
+_FILTER_PATTERN = re.compile(
+    r"(?:show me all|filter|get)\s+(?P<table>\w+)\s+(?:where|with)\s+"
+    r"(?P<column>\w+)\s+(?:is|=)\s+'?(?P<value>\w+)'?"
+)
+_WHERE_FALLBACK = re.compile(r"where\s+(\w+)\s+(is|equals|=)\s+'?(\w+)'?")
+_WHITESPACE = re.compile(r"\s+")
+# "limit N" / "top N" caps the rows a select all query returns and
+# "offset N" / "skip N" skips rows first; both are bounded by _MAX_ROWS
+_LIMIT_PATTERN = re.compile(r"\b(?:limit|top)\s+(\d+)\b")
+_OFFSET_PATTERN = re.compile(r"\b(?:offset|skip)\s+(\d+)\b")
+_MAX_ROWS = 10000
+# A "<keyword> <column> = <value>" condition marks a filter query
+_FILTER_HINT = re.compile(r"\b(?:where|filter|with|equals|is)\s+\w+\s*=\s*'?\w+'?")
+
+# Intent keywords; together with the table names they form one keyword pattern
+# so intent and table are found in a single scan of the query
+_INTENT_KEYWORDS = (
+    ("sum", ("sum of", "sum amount of", "total", "add up")),
+    ("select_all", ("show me all", "list all", "get all", "display all")),
+    ("count", ("how many", "count")),
+    ("avg", ("average", "avg"))
+)
+# Intents are resolved in this order when a query matches several
+_INTENT_PRIORITY = ("sum", "filter", "select_all", "count", "avg")
+
+# Columns sum/average queries can target, and phrases that name one outright
+_AGGREGATE_COLUMNS = ("amount", "price")
+_EXPLICIT_COLUMN_PHRASES = (
+    ("total amount of", "amount"),
+    ("sum of amount", "amount"),
+    ("total price of", "price"),
+    ("sum of price", "price")
+)
+
+# Results are cached per normalized query and database version; longer queries
+# bypass the caches so client input cannot pin large strings in memory
+_CACHE_SIZE = 1024
+_MAX_CACHED_QUERY_LENGTH = 256
+
+@dataclass(frozen=True)
+class ParsedQuery:
+    """Intent and components extracted from a normalized query"""
+    intent: str
+    table: str
+    column: Optional[str] = None
+    value: Optional[str] = None
+    limit: Optional[int] = None
+    offset: Optional[int] = None
+
 class QueryProcessor:
     # Constants for column mappings
     COLUMN_MAPPINGS = {
-        'amount': ['amount', 'total', 'sum', 'value', 'price', 'sales', 'revenue'],
-        'price': ['price', 'cost', 'value', 'amount', 'rate']
+        'amount': ('amount', 'total', 'sum', 'value', 'price', 'sales', 'revenue'),
+        'price': ('price', 'cost', 'value', 'amount', 'rate')
     }
 
     @staticmethod
     def process_query(natural_query: str) -> Dict[str, Any]:
+        """Process a query, returning a fresh result the caller may mutate"""
         try:
             if not natural_query or not isinstance(natural_query, str):
                 raise InvalidQueryError("Query must be a non-empty string")
 
-            query = natural_query.lower()
-            
-            if QueryProcessor._is_sum(query):
-                return QueryProcessor._process_sum(query)
-            elif QueryProcessor._is_filter(query):
-                return QueryProcessor._process_filter(query)
-            elif QueryProcessor._is_select_all(query):
-                return QueryProcessor._process_select_all(query)
-            elif QueryProcessor._is_count(query):
-                return QueryProcessor._process_count(query)
-            elif QueryProcessor._is_avg(query):
-                return QueryProcessor._process_avg(query)
-            else:
-                raise InvalidQueryError(
-                    "Could not determine query intent",
-                    details={"supported_intents": ["select_all", "count", "sum", "avg", "filter"]}
-                )
+            query = QueryProcessor._normalize(natural_query)
+            return copy.deepcopy(QueryProcessor._cached_call(QueryProcessor._process_cached, query))
 
-        except DatabaseError:
+        except (InvalidQueryError, DatabaseError):
             raise
         except Exception as e:
             raise InvalidQueryError(f"Error processing query: {str(e)}") from e
 
     @staticmethod
-    def _is_sum(query: str) -> bool:
-        sum_phrases = [
-            "sum of", "total", "add up", 
-            "what is the total", "calculate the total",
-            "total amount of", "sum amount of"
-        ]
-        return any(phrase in query for phrase in sum_phrases)
+    def process_queries(natural_queries: List[str]) -> List[Dict[str, Any]]:
+        """Process a batch of queries, returning one result or error per query in order"""
+        results = []
+        for natural_query in natural_queries:
+            try:
+                results.append(QueryProcessor.process_query(natural_query))
+            except (InvalidQueryError, DatabaseError) as e:
+                error = e.to_dict()
+                error["query"] = natural_query
+                results.append({"status": "error", **error})
+        return results
 
     @staticmethod
-    def _is_filter(query: str) -> bool:
-        filter_keywords = ["where", "filter", "with", "equals", "=", "is"]
-        table = QueryProcessor._find_table_in_query(query)
-        return (any(kw in query for kw in filter_keywords) and 
-                table is not None and
-                any(re.search(rf"{kw}\s+\w+\s*=\s*'?\w+'?", query) for kw in filter_keywords))
+    def _normalize(natural_query: str) -> str:
+        """Lowercase the query and collapse runs of whitespace"""
+        return _WHITESPACE.sub(" ", natural_query.strip().lower())
+
+    @staticmethod
+    def _cached_call(func, query: str):
+        """Call an lru-cached helper with the current database version, bypassing its cache for long queries"""
+        if len(query) > _MAX_CACHED_QUERY_LENGTH:
+            return func.__wrapped__(query, db_instance.version)
+        return func(query, db_instance.version)
+
+    @staticmethod
+    @lru_cache(maxsize=_CACHE_SIZE)
+    def _process_cached(query: str, version: int) -> Dict[str, Any]:
+        """Process a normalized query; version only keys the cache"""
+        parsed = QueryProcessor._cached_call(QueryProcessor._parse, query)
+        return _DISPATCH[parsed.intent](parsed)
+
+    @staticmethod
+    @lru_cache(maxsize=_CACHE_SIZE)
+    def _parse(query: str, version: int) -> ParsedQuery:
+        """Classify a normalized query and extract its components; version only keys the cache"""
+        intent = QueryProcessor._classify(query)
+        if intent in ("sum", "avg"):
+            table, column = QueryProcessor._extract_table_and_column(query, _AGGREGATE_COLUMNS)
+            return ParsedQuery(intent, table, column)
+        if intent == "filter":
+            table, column, value = QueryProcessor._extract_filter_condition(query)
+            return ParsedQuery(intent, table, column, value)
+        if intent == "select_all":
+            return ParsedQuery(
+                intent,
+                QueryProcessor._extract_table_name(query),
+                limit=QueryProcessor._extract_row_count(_LIMIT_PATTERN, query, "limit"),
+                offset=QueryProcessor._extract_row_count(_OFFSET_PATTERN, query, "offset")
+            )
+        if intent == "count":
+            return ParsedQuery(intent, QueryProcessor._extract_table_name(query))
+        
+        raise InvalidQueryError(
+            "Could not determine query intent",
+            details={"supported_intents": ["select_all", "count", "sum", "avg", "filter"]}
+        )
+
+    @staticmethod
+    def _extract_row_count(pattern: re.Pattern, query: str, name: str) -> Optional[int]:
+        """Read a "limit"/"offset" style row count, rejecting values above _MAX_ROWS"""
+        match = pattern.search(query)
+        if not match:
+            return None
+        digits = match.group(1)
+        # Compare lengths first so absurdly long numbers are never converted
+        if len(digits.lstrip("0")) > len(str(_MAX_ROWS)) or int(digits) > _MAX_ROWS:
+            raise InvalidQueryError(
+                f"{name.capitalize()} must be at most {_MAX_ROWS}",
+                details={f"max_{name}": _MAX_ROWS}
+            )
+        return int(digits)
+
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _keyword_pattern(version: int) -> re.Pattern:
+        """Alternation of every intent keyword and table name, one named group each kind"""
+        groups = [
+            f"(?P<{intent}>{'|'.join(map(re.escape, phrases))})"
+            for intent, phrases in _INTENT_KEYWORDS
+        ]
+        tables = sorted(db_instance.get_table_names(), key=len, reverse=True)
+        if tables:
+            # Longest names first, whole words only, so one table name never
+            # matches inside another or inside an unrelated word
+            groups.append(f"(?P<table>\\b(?:{'|'.join(map(re.escape, tables))})\\b)")
+        return re.compile("|".join(groups))
 
     @staticmethod
-    def _is_select_all(query: str) -> bool:
-        return any(phrase in query for phrase in ["show me all", "list all", "get all", "display all"])
+    @lru_cache(maxsize=_CACHE_SIZE)
+    def _scan_keywords(query: str, version: int) -> Tuple[FrozenSet[str], FrozenSet[str]]:
+        """Intents and table names appearing in the query, found in one pass"""
+        intents, tables = set(), set()
+        for match in QueryProcessor._keyword_pattern(version).finditer(query):
+            if match.lastgroup == "table":
+                tables.add(match["table"])
+            else:
+                intents.add(match.lastgroup)
+        return frozenset(intents), frozenset(tables)
 
     @staticmethod
-    def _is_count(query: str) -> bool:
-        return "how many" in query or "count" in query
+    def _classify(query: str) -> Optional[str]:
+        """Highest-priority intent of the query, or None if nothing matches"""
+        intents, _ = QueryProcessor._cached_call(QueryProcessor._scan_keywords, query)
+        for intent in _INTENT_PRIORITY:
+            if intent in intents or (intent == "filter" and QueryProcessor._matches_filter(query)):
+                return intent
+        return None
 
     @staticmethod
-    def _is_avg(query: str) -> bool:
-        return "average" in query or "avg" in query
+    def _matches_filter(query: str) -> bool:
+        """Check the query names a table and has a <keyword> <column> = <value> condition"""
+        return (_FILTER_HINT.search(query) is not None and
+                QueryProcessor._find_table_in_query(query) is not None)
 
     @staticmethod
-    def _process_sum(query: str) -> Dict[str, Any]:
+    def _process_sum(parsed: ParsedQuery) -> Dict[str, Any]:
         """Process sum query"""
+        table, column = parsed.table, parsed.column
         try:
-            table, column = QueryProcessor._extract_table_and_column(query, ["amount", "price"])
-            data = db_instance.get_table(table)
-            
-            # Validate column is numeric
-            if not all(isinstance(item.get(column), (int, float)) for item in data):
-                raise InvalidQueryError(f"Column '{column}' is not numeric")
-            
-            total = sum(float(item[column]) for item in data)
-            return {
-                "status": "success",
-                "query_type": "sum",
-                "table": table,
-                "column": column,
-                "total": total
-            }
+            metrics = QueryProcessor._column_metrics(table, column, db_instance.version)
+        except InvalidQueryError:
+            raise
         except Exception as e:
             raise DatabaseError(
-                f"Failed to calculate sum for {column or 'unknown'} in {table or 'unknown'}",
+                f"Failed to calculate sum for {column} in {table}",
                 details={"error": str(e)}
-            )
+            ) from e
+        
+        return {
+            "status": "success",
+            "query_type": "sum",
+            "table": table,
+            "column": column,
+            "total": metrics["sum"]
+        }
 
     @staticmethod
-    def _process_filter(query: str) -> Dict[str, Any]:
+    def _process_filter(parsed: ParsedQuery) -> Dict[str, Any]:
         """Process filter query"""
+        table, column, value = parsed.table, parsed.column, parsed.value
         try:
-            table, column, value = QueryProcessor._extract_filter_condition(query)
-            data = db_instance.get_table(table)
-            
-            filtered = [
-                item for item in data 
-                if str(item.get(column, "")).lower() == value.lower()
-            ]
-            
-            return {
-                "status": "success",
-                "query_type": "filter",
-                "table": table,
-                "filter_column": column,
-                "filter_value": value,
-                "results": filtered,
-                "count": len(filtered)
-            }
+            filtered = db_instance.find_rows(table, column, value)
         except Exception as e:
-            raise DatabaseError(f"Failed to filter records: {str(e)}")
+            raise DatabaseError(f"Failed to filter records: {str(e)}") from e
+        
+        return {
+            "status": "success",
+            "query_type": "filter",
+            "table": table,
+            "filter_column": column,
+            "filter_value": value,
+            "results": filtered,
+            "count": len(filtered)
+        }
 
     @staticmethod
-    def _process_select_all(query: str) -> Dict[str, Any]:
+    def _process_select_all(parsed: ParsedQuery) -> Dict[str, Any]:
         """Process select all query"""
+        table = parsed.table
         try:
-            table = QueryProcessor._extract_table_name(query)
             data = db_instance.get_table(table)
-            return {
-                "status": "success",
-                "query_type": "select_all",
-                "table": table,
-                "results": data,
-                "count": len(data)
-            }
         except Exception as e:
-            raise DatabaseError(f"Failed to retrieve data: {str(e)}")
+            raise DatabaseError(f"Failed to retrieve data: {str(e)}") from e
+        
+        result = {
+            "status": "success",
+            "query_type": "select_all",
+            "table": table,
+            "results": data,
+            "count": len(data)
+        }
+        if parsed.limit is not None or parsed.offset is not None:
+            start = parsed.offset or 0
+            end = start + parsed.limit if parsed.limit is not None else None
+            # count stays the table size so clients can page through it
+            result["results"] = data[start:end]
+            result["returned"] = len(result["results"])
+            if parsed.limit is not None:
+                result["limit"] = parsed.limit
+            if parsed.offset is not None:
+                result["offset"] = parsed.offset
+        return result
 
     @staticmethod
-    def _process_count(query: str) -> Dict[str, Any]:
+    def _process_count(parsed: ParsedQuery) -> Dict[str, Any]:
         """Process count query"""
+        table = parsed.table
         try:
-            table = QueryProcessor._extract_table_name(query)
             data = db_instance.get_table(table)
-            return {
-                "status": "success",
-                "query_type": "count",
-                "table": table,
-                "count": len(data)
-            }
         except Exception as e:
-            raise DatabaseError(f"Failed to count records: {str(e)}")
+            raise DatabaseError(f"Failed to count records: {str(e)}") from e
+        
+        return {
+            "status": "success",
+            "query_type": "count",
+            "table": table,
+            "count": len(data)
+        }
 
     @staticmethod
-    def _process_avg(query: str) -> Dict[str, Any]:
+    def _process_avg(parsed: ParsedQuery) -> Dict[str, Any]:
         """Process average query"""
+        table, column = parsed.table, parsed.column
         try:
-            table, column = QueryProcessor._extract_table_and_column(query, ["amount", "price"])
-            data = db_instance.get_table(table)
-            
-            if not data:
-                return {
-                    "status": "success",
-                    "query_type": "average",
-                    "table": table,
-                    "column": column,
-                    "average": 0,
-                    "count": 0,
-                    "warning": "Table is empty"
-                }
-            
-            if not all(isinstance(item.get(column), (int, float)) for item in data):
-                raise InvalidQueryError(f"Column '{column}' is not numeric")
-            
-            total = sum(float(item[column]) for item in data)
-            avg = total / len(data)
+            metrics = QueryProcessor._column_metrics(table, column, db_instance.version)
+        except InvalidQueryError:
+            raise
+        except Exception as e:
+            raise DatabaseError(f"Failed to calculate average: {str(e)}") from e
+        
+        if not metrics["count"]:
             return {
                 "status": "success",
                 "query_type": "average",
                 "table": table,
                 "column": column,
-                "average": avg,
-                "count": len(data)
+                "average": 0,
+                "count": 0,
+                "warning": "Table is empty"
             }
-        except Exception as e:
-            raise DatabaseError(f"Failed to calculate average: {str(e)}")
+        
+        return {
+            "status": "success",
+            "query_type": "average",
+            "table": table,
+            "column": column,
+            "average": metrics["sum"] / metrics["count"],
+            "count": metrics["count"]
+        }
+
+    @staticmethod
+    @lru_cache(maxsize=_CACHE_SIZE)
+    def _column_metrics(table: str, column: str, version: int) -> Dict[str, float]:
+        """Sum and row count of a numeric column; version only keys the cache"""
+        values = db_instance.get_numeric_column(table, column)
+        if values is None:
+            raise InvalidQueryError(f"Column '{column}' is not numeric")
+        
+        return {
+            "sum": sum(values),
+            "count": len(values)
+        }
 
     @staticmethod
     def _extract_table_name(query: str) -> str:
         """Extract table name from query"""
-        available_tables = db_instance.get_table_names()
-        for table in available_tables:
-            if table in query:
-                return table
+        table = QueryProcessor._find_table_in_query(query)
+        if table is not None:
+            return table
         
         raise InvalidQueryError(
             "Could not determine table name",
-            details={"available_tables": available_tables}
+            details={"available_tables": list(db_instance.get_table_names())}
         )
 
     @staticmethod
     def _find_table_in_query(query: str) -> Optional[str]:
         """Find table name in query without raising error"""
-        available_tables = db_instance.get_table_names()
-        for table in available_tables:
-            if table in query:
+        _, found = QueryProcessor._cached_call(QueryProcessor._scan_keywords, query)
+        for table in db_instance.get_table_names():
+            if table in found:
                 return table
         return None
 
     @staticmethod
-    def _extract_table_and_column(query: str, possible_columns: list) -> Tuple[str, str]:
+    def _extract_table_and_column(query: str, possible_columns: Tuple[str, ...]) -> Tuple[str, str]:
         """Extract table and column from query"""
-        try:
-            table = QueryProcessor._extract_table_name(query)
-            
-            if "total amount of" in query or "sum of amount" in query:
-                return table, "amount"
-            if "total price of" in query or "sum of price" in query:
-                return table, "price"
-            
-            for col in possible_columns:
-                if col in query:
-                    return table, col
-            
-            for col, synonyms in QueryProcessor.COLUMN_MAPPINGS.items():
-                if any(synonym in query for synonym in synonyms):
-                    if col in db_instance.get_table_columns(table):
-                        return table, col
-            
+        table = QueryProcessor._extract_table_name(query)
+        column = QueryProcessor._find_column(query, table, possible_columns)
+        if column is None:
             raise InvalidQueryError(
                 "Could not determine column to process",
-                details={"available_columns": db_instance.get_table_columns(table)}
+                details={"available_columns": list(db_instance.get_table_columns(table))}
             )
-        except Exception as e:
-            raise InvalidQueryError(f"Failed to extract table/column: {str(e)}")
+        return table, column
+
+    @staticmethod
+    def _find_column(query: str, table: str, possible_columns: Tuple[str, ...]) -> Optional[str]:
+        """Find the column to aggregate without raising error"""
+        for phrase, col in _EXPLICIT_COLUMN_PHRASES:
+            if phrase in query:
+                return col
+        
+        for col in possible_columns:
+            if col in query:
+                return col
+        
+        # Columns named by any synonym in the query, found in one pass
+        candidates = {
+            col for synonym in _SYNONYM_PATTERN.findall(query)
+            for col in _SYNONYM_COLUMNS[synonym]
+        }
+        table_columns = db_instance.get_table_columns(table)
+        for col in QueryProcessor.COLUMN_MAPPINGS:
+            if col in candidates and col in table_columns:
+                return col
+        return None
 
     @staticmethod
     def _extract_filter_condition(query: str) -> Tuple[str, str, str]:
         """Extract filter condition from query"""
-        patterns = [
-            r"show me all (\w+)\s+where\s+(\w+)\s+is\s+(\w+)",
-            r"filter\s+(\w+)\s+where\s+(\w+)\s+=\s+'?(\w+)'?",
-            r"get\s+(\w+)\s+with\s+(\w+)\s+=\s+'?(\w+)'?"
-        ]
+        match = _FILTER_PATTERN.search(query)
+        if match:
+            return match["table"], match["column"], match["value"]
         
-        for pattern in patterns:
-            match = re.search(pattern, query, re.IGNORECASE)
-            if match and len(match.groups()) == 3:
-                return match.group(1), match.group(2), match.group(3).lower()
+        table = QueryProcessor._extract_table_name(query)
+        where_match = _WHERE_FALLBACK.search(query)
+        if where_match:
+            return table, where_match.group(1), where_match.group(3)
         
-        try:
-            table = QueryProcessor._extract_table_name(query)
-            where_match = re.search(r"where\s+(\w+)\s+(is|equals|=)\s+'?(\w+)'?", query, re.IGNORECASE)
-            if where_match:
-                return table, where_match.group(1), where_match.group(3).lower()
-            
-            raise InvalidQueryError(
-                "Could not parse filter condition",
-                details={
-                    "expected_patterns": [
-                        "Show me all <table> where <column> is <value>",
-                        "Filter <table> where <column> = <value>"
-                    ]
-                }
-            )
-        except Exception as e:
-            raise InvalidQueryError(f"Failed to extract filter condition: {str(e)}")
+        raise InvalidQueryError(
+            "Could not parse filter condition",
+            details={
+                "expected_patterns": [
+                    "Show me all <table> where <column> is <value>",
+                    "Filter <table> where <column> = <value>"
+                ]
+            }
+        )
         
     @staticmethod
     def explain_query(natural_query: str) -> Dict[str, Any]:
-        """Explain how a query would be processed"""
+        """Explain how a query would be processed, returning a fresh result the caller may mutate"""
         try:
             if not natural_query or not isinstance(natural_query, str):
                 raise InvalidQueryError("Query must be a non-empty string")
 
-            query = natural_query.lower()
-            explanation = {
-                "status": "success",
-                "query": natural_query,
-                "processing_steps": [],
-                "query_type": None,
-                "table": None,
-                "column": None
-            }
-
-            # Determine query type and build explanation
-            if QueryProcessor._is_sum(query):
-                explanation["query_type"] = "sum"
-                table, column = QueryProcessor._extract_table_and_column(query, ["amount", "price"])
-                explanation.update({
-                    "table": table,
-                    "column": column,
-                    "processing_steps": [
-                        f"Identified as sum query",
-                        f"Extracted table name: {table}",
-                        f"Selected column for summation: {column}",
-                        f"Will calculate sum of {column} values from {table} table"
-                    ]
-                })
-            elif QueryProcessor._is_filter(query):
-                explanation["query_type"] = "filter"
-                table, column, value = QueryProcessor._extract_filter_condition(query)
-                explanation.update({
-                    "table": table,
-                    "filter_column": column,
-                    "filter_value": value,
-                    "processing_steps": [
-                        f"Identified as filter query",
-                        f"Extracted table name: {table}",
-                        f"Identified filter condition: {column} = {value}",
-                        f"Will retrieve records from {table} where {column} matches {value}"
-                    ]
-                })
-            elif QueryProcessor._is_select_all(query):
-                explanation["query_type"] = "select_all"
-                table = QueryProcessor._extract_table_name(query)
-                explanation.update({
-                    "table": table,
-                    "processing_steps": [
-                        f"Identified as select all query",
-                        f"Extracted table name: {table}",
-                        f"Will retrieve all records from {table} without filtering"
-                    ]
-                })
-            elif QueryProcessor._is_count(query):
-                explanation["query_type"] = "count"
-                table = QueryProcessor._extract_table_name(query)
-                explanation.update({
-                    "table": table,
-                    "processing_steps": [
-                        f"Identified as count query",
-                        f"Extracted table name: {table}",
-                        f"Will count all records in {table} table"
-                    ]
-                })
-            elif QueryProcessor._is_avg(query):
-                explanation["query_type"] = "average"
-                table, column = QueryProcessor._extract_table_and_column(query, ["amount", "price"])
-                explanation.update({
-                    "table": table,
-                    "column": column,
-                    "processing_steps": [
-                        f"Identified as average query",
-                        f"Extracted table name: {table}",
-                        f"Selected column for averaging: {column}",
-                        f"Will calculate average of {column} values from {table} table"
-                    ]
-                })
-            else:
-                raise InvalidQueryError(
-                    "Could not determine query intent",
-                    details={"supported_intents": ["select_all", "count", "sum", "avg", "filter"]}
-                )
-
+            query = QueryProcessor._normalize(natural_query)
+            explanation = copy.deepcopy(QueryProcessor._cached_call(QueryProcessor._explain_cached, query))
+            explanation["query"] = natural_query
             return explanation
 
         except InvalidQueryError as e:
@@ -357,7 +420,7 @@ class QueryProcessor:
                 "error": "InvalidQueryError",
                 "message": str(e),
                 "query": natural_query,
-                "details": getattr(e, "details", None),
+                "details": e.details or {},
                 "suggestion": "Try rephrasing your query using one of the supported patterns"
             }
         except Exception as e:
@@ -371,92 +434,199 @@ class QueryProcessor:
                     "suggestion": "Check your query syntax and try again"
                 }
             }
+
+    @staticmethod
+    @lru_cache(maxsize=_CACHE_SIZE)
+    def _explain_cached(query: str, version: int) -> Dict[str, Any]:
+        """Build the explanation for a normalized query; version only keys the cache"""
+        explanation = {
+            "status": "success",
+            "query": query,
+            "processing_steps": [],
+            "query_type": None,
+            "table": None,
+            "column": None
+        }
+
+        # Determine query type and build explanation
+        parsed = QueryProcessor._cached_call(QueryProcessor._parse, query)
+        table, column = parsed.table, parsed.column
+        if parsed.intent == "sum":
+            explanation["query_type"] = "sum"
+            explanation.update({
+                "table": table,
+                "column": column,
+                "processing_steps": [
+                    f"Identified as sum query",
+                    f"Extracted table name: {table}",
+                    f"Selected column for summation: {column}",
+                    f"Will calculate sum of {column} values from {table} table"
+                ]
+            })
+        elif parsed.intent == "filter":
+            explanation["query_type"] = "filter"
+            explanation.update({
+                "table": table,
+                "filter_column": column,
+                "filter_value": parsed.value,
+                "processing_steps": [
+                    f"Identified as filter query",
+                    f"Extracted table name: {table}",
+                    f"Identified filter condition: {column} = {parsed.value}",
+                    f"Will retrieve records from {table} where {column} matches {parsed.value}"
+                ]
+            })
+        elif parsed.intent == "select_all":
+            explanation["query_type"] = "select_all"
+            explanation.update({
+                "table": table,
+                "processing_steps": [
+                    f"Identified as select all query",
+                    f"Extracted table name: {table}",
+                    f"Will retrieve all records from {table} without filtering"
+                ]
+            })
+            if parsed.limit is not None:
+                explanation["limit"] = parsed.limit
+                explanation["processing_steps"].append(
+                    f"Will return at most {parsed.limit} record{'' if parsed.limit == 1 else 's'}"
+                )
+            if parsed.offset is not None:
+                explanation["offset"] = parsed.offset
+                explanation["processing_steps"].append(
+                    f"Will skip the first {parsed.offset} record{'' if parsed.offset == 1 else 's'}"
+                )
+        elif parsed.intent == "count":
+            explanation["query_type"] = "count"
+            explanation.update({
+                "table": table,
+                "processing_steps": [
+                    f"Identified as count query",
+                    f"Extracted table name: {table}",
+                    f"Will count all records in {table} table"
+                ]
+            })
+        elif parsed.intent == "avg":
+            explanation["query_type"] = "average"
+            explanation.update({
+                "table": table,
+                "column": column,
+                "processing_steps": [
+                    f"Identified as average query",
+                    f"Extracted table name: {table}",
+                    f"Selected column for averaging: {column}",
+                    f"Will calculate average of {column} values from {table} table"
+                ]
+            })
+
+        return explanation
+
     @staticmethod
     def validate_query(natural_query: str) -> Dict[str, Any]:
-        """Validate if a query can be processed"""
+        """Validate if a query can be processed, returning a fresh result the caller may mutate"""
         try:
             if not natural_query or not isinstance(natural_query, str):
                 raise InvalidQueryError("Query must be a non-empty string")
 
-            query = natural_query.lower()
-            validation_result = {
-                "status": "success",
-                "valid": True,
+            query = QueryProcessor._normalize(natural_query)
+            validation_result = copy.deepcopy(QueryProcessor._cached_call(QueryProcessor._validate_cached, query))
+            validation_result["query"] = natural_query
+            return validation_result
+
+        except Exception as e:
+            return {
+                "status": "error",
+                "valid": False,
                 "query": natural_query,
-                "components": {
-                    "table": None,
-                    "columns": [],
-                    "conditions": []
-                },
-                "issues": []
+                "error": str(e),
+                "suggestion": "Check your query syntax and try again"
             }
 
-            # Extract components based on query type
-            if QueryProcessor._is_sum(query):
-                try:
-                    table, column = QueryProcessor._extract_table_and_column(query, ["amount", "price"])
-                    validation_result["components"]["table"] = table
-                    validation_result["components"]["columns"].append(column)
-                except Exception as e:
-                    validation_result["valid"] = False
-                    validation_result["issues"].append(str(e))
-            
-            elif QueryProcessor._is_filter(query):
-                try:
-                    table, column, value = QueryProcessor._extract_filter_condition(query)
-                    validation_result["components"]["table"] = table
-                    validation_result["components"]["columns"].append(column)
+    @staticmethod
+    @lru_cache(maxsize=_CACHE_SIZE)
+    def _validate_cached(query: str, version: int) -> Dict[str, Any]:
+        """Validate a normalized query; version only keys the cache"""
+        validation_result = {
+            "status": "success",
+            "valid": True,
+            "query": query,
+            "components": {
+                "table": None,
+                "columns": [],
+                "conditions": []
+            },
+            "issues": []
+        }
+
+        # Extract components based on query type
+        intent = QueryProcessor._classify(query)
+        if intent in ("sum", "filter"):
+            try:
+                parsed = QueryProcessor._cached_call(QueryProcessor._parse, query)
+                validation_result["components"]["table"] = parsed.table
+                validation_result["components"]["columns"].append(parsed.column)
+                if intent == "filter":
                     validation_result["components"]["conditions"].append({
-                        "column": column,
+                        "column": parsed.column,
                         "operator": "=",
-                        "value": value
+                        "value": parsed.value
                     })
-                except Exception as e:
-                    validation_result["valid"] = False
-                    validation_result["issues"].append(str(e))
-            
-            # Add similar blocks for other query types...
-            else:
+            except Exception as e:
                 validation_result["valid"] = False
-                validation_result["issues"].append("Could not determine query type")
-
-            # Validate the extracted components
-            if validation_result["valid"]:
-                table = validation_result["components"]["table"]
-                
-                # Check table exists
-                if not table or table not in db_instance.get_table_names():
+                validation_result["issues"].append(str(e))
+
+        # Add similar blocks for other query types...
+        else:
+            validation_result["valid"] = False
+            validation_result["issues"].append("Could not determine query type")
+
+        # Validate the extracted components
+        if validation_result["valid"]:
+            table = validation_result["components"]["table"]
+
+            # Check table exists
+            if not table or table not in db_instance.get_table_names():
+                validation_result["valid"] = False
+                validation_result["issues"].append(
+                    f"Table '{table}' not found. Available tables: {list(db_instance.get_table_names())}"
+                )
+
+            # Check columns exist in table
+            for col in validation_result["components"]["columns"]:
+                if col not in db_instance.get_table_columns(table):
                     validation_result["valid"] = False
                     validation_result["issues"].append(
-                        f"Table '{table}' not found. Available tables: {db_instance.get_table_names()}"
+                        f"Column '{col}' not found in table '{table}'. "
+                        f"Available columns: {list(db_instance.get_table_columns(table))}"
                     )
-                
-                # Check columns exist in table
-                for col in validation_result["components"]["columns"]:
-                    if col not in db_instance.get_table_columns(table):
-                        validation_result["valid"] = False
-                        validation_result["issues"].append(
-                            f"Column '{col}' not found in table '{table}'. "
-                            f"Available columns: {db_instance.get_table_columns(table)}"
-                        )
-                
-                # For sum/avg queries, check column is numeric
-                if QueryProcessor._is_sum(query) or QueryProcessor._is_avg(query):
-                    column = validation_result["components"]["columns"][0]
-                    sample_data = db_instance.get_table(table)[0] if db_instance.get_table(table) else {}
-                    if not isinstance(sample_data.get(column), (int, float)):
-                        validation_result["valid"] = False
-                        validation_result["issues"].append(
-                            f"Column '{column}' is not numeric and cannot be used for sum/average"
-                        )
 
-            return validation_result
+            # For queries mentioning sum/average keywords, check column is numeric
+            keywords, _ = QueryProcessor._cached_call(QueryProcessor._scan_keywords, query)
+            if "sum" in keywords or "avg" in keywords:
+                column = validation_result["components"]["columns"][0]
+                if not db_instance.is_numeric_column(table, column):
+                    validation_result["valid"] = False
+                    validation_result["issues"].append(
+                        f"Column '{column}' is not numeric and cannot be used for sum/average"
+                    )
 
-        except Exception as e:
-            return {
-                "status": "error",
-                "valid": False,
-                "query": natural_query,
-                "error": str(e),
-                "suggestion": "Check your query syntax and try again"
-            }
\ No newline at end of file
+        return validation_result
+
+
+_DISPATCH = {
+    "sum": QueryProcessor._process_sum,
+    "filter": QueryProcessor._process_filter,
+    "select_all": QueryProcessor._process_select_all,
+    "count": QueryProcessor._process_count,
+    "avg": QueryProcessor._process_avg
+}
+
+# Reverse index of COLUMN_MAPPINGS: synonym -> columns it may refer to, in mapping order
+_SYNONYM_COLUMNS = {
+    synonym: tuple(col for col, synonyms in QueryProcessor.COLUMN_MAPPINGS.items() if synonym in synonyms)
+    for synonyms in QueryProcessor.COLUMN_MAPPINGS.values()
+    for synonym in synonyms
+}
+_SYNONYM_PATTERN = re.compile(
+    "|".join(map(re.escape, sorted(_SYNONYM_COLUMNS, key=len, reverse=True)))
+)
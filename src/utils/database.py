@@ -1,12 +1,21 @@
-from typing import Dict, List, Optional, Any
+from array import array
+from collections import defaultdict
+from typing import Dict, List, Optional, Any, Tuple
 from src.config.config import Config
 
 class Database:
     def __init__(self):
         self.tables = {}
+        self.table_names = ()
+        self.table_columns = {}
+        self.numeric_columns = {}
+        self.filter_index = {}
+        self.version = 0
         self._initialize_database()
     
     def _initialize_database(self):
+        self.numeric_columns.clear()
+        self.filter_index.clear()
         for table_name, table_def in Config.DATABASE_SCHEMA.items():
             columns = table_def["columns"]
             sample_data = table_def["sample_data"]
@@ -14,18 +23,46 @@ class Database:
             self.tables[table_name] = [
                 dict(zip(columns, row)) for row in sample_data
             ]
+            self.table_columns[table_name] = tuple(columns)
 
-    def get_table_names(self) -> List[str]:
-        """Returns a list of all table names."""
-        return list(self.tables.keys())
+            # Column-major view used only to build the indexes below
+            for index, column in enumerate(columns):
+                values = [row[index] for row in sample_data]
+
+                # Lowercased value -> row positions, so equality filters are a dict lookup
+                positions = defaultdict(list)
+                for position, value in enumerate(values):
+                    positions[str(value).lower()].append(position)
+                self.filter_index[(table_name, column)] = positions
+
+                # Numeric columns are validated once and stored as contiguous doubles
+                if all(isinstance(value, (int, float)) for value in values):
+                    self.numeric_columns[(table_name, column)] = array('d', values)
+        self.table_names = tuple(self.tables.keys())
+        self.version += 1
+
+    def get_table_names(self) -> Tuple[str, ...]:
+        """Returns a tuple of all table names."""
+        return self.table_names
 
     def get_table(self, table_name: str) -> List[Dict[str, Any]]:
         return self.tables.get(table_name, [])
 
-    def get_table_columns(self, table_name: str) -> Optional[List[str]]:
-        if table_name not in self.tables or not self.tables[table_name]:
-            return None
-        return list(self.tables[table_name][0].keys())
+    def get_table_columns(self, table_name: str) -> Optional[Tuple[str, ...]]:
+        return self.table_columns.get(table_name)
+
+    def get_numeric_column(self, table_name: str, column: str) -> Optional[array]:
+        """Returns the column as an array of doubles, or None if it is not numeric."""
+        return self.numeric_columns.get((table_name, column))
+
+    def is_numeric_column(self, table_name: str, column: str) -> bool:
+        return (table_name, column) in self.numeric_columns
+
+    def find_rows(self, table_name: str, column: str, value: str) -> List[Dict[str, Any]]:
+        """Returns rows whose column matches value, ignoring case."""
+        index = self.filter_index.get((table_name, column), {})
+        rows = self.get_table(table_name)
+        return [rows[position] for position in index.get(value.lower(), [])]
 
     def table_exists(self, table_name: str) -> bool:
         return table_name in self.tables
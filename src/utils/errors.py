@@ -2,7 +2,7 @@ class InvalidQueryError(Exception):
     def __init__(self, message: str, query: str = None, details: dict = None):
         self.message = message
         self.query = query
-        self.details = details or {}
+        self.details = details
         super().__init__(self.message)
 
     def __str__(self):
@@ -18,7 +18,7 @@ class InvalidQueryError(Exception):
             'error': 'InvalidQueryError',
             'message': self.message,
             'query': self.query,
-            'details': self.details
+            'details': self.details or {}
         }
 
 
@@ -27,7 +27,7 @@ class DatabaseError(Exception):
         self.message = message
         self.operation = operation
         self.table = table
-        self.details = details or {}
+        self.details = details
         super().__init__(self.message)
 
     def __str__(self):
@@ -46,5 +46,5 @@ class DatabaseError(Exception):
             'message': self.message,
             'operation': self.operation,
             'table': self.table,
-            'details': self.details
+            'details': self.details or {}
         }
\ No newline at end of file
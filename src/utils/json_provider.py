@@ -0,0 +1,34 @@
+import orjson
+from flask.json.provider import DefaultJSONProvider
+
+# Arguments orjson can honour; anything else goes through the stdlib encoder
+_ORJSON_KWARGS = frozenset({"indent", "separators", "sort_keys", "ensure_ascii"})
+# Dates and dataclasses go through Flask's default() so they keep Flask's formats
+_ORJSON_BASE_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider that serializes responses with orjson, falling back to the stdlib encoder.
+
+    Unlike the stdlib encoder, NaN and infinite floats are written as null.
+    """
+
+    def dumps(self, obj, **kwargs) -> str:
+        indent = kwargs.get("indent")
+        if indent not in (None, 2) or not _ORJSON_KWARGS.issuperset(kwargs):
+            return super().dumps(obj, **kwargs)
+
+        option = _ORJSON_BASE_OPTIONS
+        if kwargs.get("sort_keys", self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            output = orjson.dumps(obj, default=self.default, option=option).decode()
+        except orjson.JSONEncodeError:
+            # e.g. integers wider than 64 bits or non-str dict keys
+            return super().dumps(obj, **kwargs)
+
+        # orjson always writes UTF-8; let the stdlib escape non-ASCII text when asked to
+        if kwargs.get("ensure_ascii", self.ensure_ascii) and not output.isascii():
+            return super().dumps(obj, **kwargs)
+        return output